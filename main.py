@@ -2,14 +2,13 @@ import argparse
 from datetime import datetime
 from scanner import BitDevsRadar
 from views import (
-    generate_category_view,
-    generate_domain_view,
-    generate_date_view,
+    generate_all_views,
+    precompute_derived,
     save_detailed_view,
 )
 from loguru import logger
 import sys
-import json
+import orjson
 
 
 def setup_logging(debug_mode: bool = False):
@@ -40,8 +39,8 @@ def setup_logging(debug_mode: bool = False):
 def load_json_data(json_path: str) -> dict:
     """Load data from a JSON file."""
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(json_path, "rb") as f:
+            return orjson.loads(f.read())
     except Exception as e:
         logger.error(f"Error loading JSON file: {e}")
         raise
@@ -55,10 +54,11 @@ def generate_views(data: dict, args: argparse.Namespace) -> None:
     if not args.detailed_input or args.detailed_output != args.detailed_input:
         save_detailed_view(data, args.detailed_output)
 
+    # Derive per-resource fields once, after saving so they stay out of the JSON
+    precompute_derived(data)
+
     # Generate all markdown views
-    generate_category_view(data, args.category_output)
-    generate_domain_view(data, args.domain_output)
-    generate_date_view(data, args.date_output)
+    generate_all_views(data, args.category_output, args.domain_output, args.date_output)
 
 
 def scan_repositories(args: argparse.Namespace, start_date: datetime) -> dict:
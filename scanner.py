@@ -1,37 +1,62 @@
 import yaml
-import git
+import bisect
+import html
+import mmap
 import os
+import subprocess
+import sys
 import re
 from pathlib import Path
 from datetime import datetime
-import markdown
-from bs4 import BeautifulSoup
 import shutil
+import stat
 from typing import Dict, List, Tuple, Optional, Set
 import tempfile
+import ahocorasick
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from loguru import logger
 
 
 class Resource:
+    __slots__ = (
+        "url",
+        "titles",
+        "dates",
+        "sources",
+        "categories",
+        "titles_used",
+        "cached_dict",
+    )
+
     def __init__(self, url: str):
         self.url = url
         self.titles = set()  # Track all titles used for this URL
-        self.occurrences = (
-            []
-        )  # List of (date, source_file_url, category_path, title) tuples
+        # Occurrences are stored as parallel lists, one entry per occurrence
+        self.dates = []
+        self.sources = []
+        self.categories = []
+        self.titles_used = []
+        self.cached_dict = None
 
     def add_occurrence(
         self, date: datetime, source_file_url: str, category_path: str, title: str
     ):
         self.titles.add(title)
-        self.occurrences.append((date, source_file_url, category_path, title))
-        logger.debug(f"Added occurrence for {self.url} from {source_file_url}")
+        self.dates.append(date)
+        self.sources.append(source_file_url)
+        self.categories.append(category_path)
+        self.titles_used.append(title)
+        self.cached_dict = None
+        logger.debug("Added occurrence for {} from {}", self.url, source_file_url)
 
     def to_dict(self):
-        return {
+        """Return the dictionary form, built once and reused until it changes."""
+        if self.cached_dict is not None:
+            return self.cached_dict
+        self.cached_dict = {
             "url": self.url,
             "titles": list(self.titles),
-            "count": len(self.occurrences),
+            "count": len(self.dates),
             "occurrences": [
                 {
                     "date": date.strftime("%Y-%m-%d"),
@@ -39,32 +64,266 @@ class Resource:
                     "category": category_path,
                     "title_used": title,
                 }
-                for date, source_url, category_path, title in self.occurrences
+                for date, source_url, category_path, title in zip(
+                    self.dates, self.sources, self.categories, self.titles_used
+                )
             ],
         }
+        return self.cached_dict
 
 
 class HeadingTracker:
     def __init__(self):
-        self.current_path = []
+        # Parallel stacks of heading levels and texts; levels strictly increase
+        self.levels = []
+        self.texts = []
 
     def update_heading(self, text: str, level: int):
         """Update the current heading path based on new heading."""
         # Remove any headings at the same or lower level
-        while self.current_path and self.get_last_level() >= level:
-            self.current_path.pop()
+        index = bisect.bisect_left(self.levels, level)
+        del self.levels[index:]
+        del self.texts[index:]
 
         # Add the new heading
-        self.current_path.append((level, text.strip()))
-        logger.trace(f"Updated heading path: {self.get_category_path()}")
+        self.levels.append(level)
+        self.texts.append(text.strip())
 
     def get_last_level(self) -> int:
         """Get the level of the last heading in the path."""
-        return self.current_path[-1][0] if self.current_path else 0
+        return self.levels[-1] if self.levels else 0
 
     def get_category_path(self) -> str:
         """Get the full category path as a string."""
-        return " / ".join(text for _, text in self.current_path)
+        return " / ".join(self.texts)
+
+
+# Excluded-domain matcher for worker processes, set once by init_worker
+worker_excluded_matcher = None
+
+
+def build_excluded_matcher(domains: Set[str]) -> Optional[ahocorasick.Automaton]:
+    """Build an Aho-Corasick automaton matching any of the excluded domains."""
+    if not domains:
+        return None
+    automaton = ahocorasick.Automaton()
+    for domain in domains:
+        automaton.add_word(domain, domain)
+    automaton.make_automaton()
+    return automaton
+
+
+# Bytes patterns, so posts can be scanned straight from a memory map
+# A backtick fence's info string can't contain backticks (so ```code``` on a
+# line of its own is inline code), and an unclosed fence is just text
+FENCE_RE = re.compile(
+    rb"^ {0,3}(?P<fence>`{3,}(?![^\n]*`)|~{3,})[^\n]*\n"
+    rb".*?^ {0,3}(?P=fence)[`~]*[ \t]*\r?$",
+    re.M | re.S,
+)
+# Same rules as python-markdown's hash headers (no space needed after the
+# hashes, trailing hashes dropped), which also apply inside blockquotes and
+# list items
+HEADING_RE = re.compile(
+    rb"^(?:[ ]*(?:>[ \t]?|(?:[*+-]|\d+\.)[ \t]+))*"
+    rb"(?P<hashes>#{1,6})(?P<text>(?:\\.|[^\\\n])*?)#*\r?$",
+    re.M,
+)
+SETEXT_HEADING_RE = re.compile(
+    rb"^(?P<text>[^#\s][^\n]*?)[ \t]*\r?\n(?P<underline>=+|-+)[ \t]*\r?$", re.M
+)
+REFERENCE_DEF_RE = re.compile(
+    rb"^ {0,3}\[(?P<label>[^\]\n]+)\]:[ \t]*<?(?P<url>[^\s>]+)>?"
+    rb"(?:[ \t]+(?:\"[^\"\n]*\"|'[^'\n]*'|\([^)\n]*\)))?[ \t]*\r?$",
+    re.M,
+)
+# Inline spans may wrap lines but never cross a blank line
+SAME_BLOCK = rb"(?:[^\n]|\n(?![ \t]*\r?\n))"
+LINK_TEXT = rb"(?:[^\[\]\n]|\n(?![ \t]*\r?\n)|\[[^\[\]\n]*\])+"
+LINK_URL = rb"(?:[^()\s<>]|\([^()\s]*\))+"
+LINK_TITLE = rb"(?:\"[^\"]*\"|'[^']*'|\([^)]*\))"
+INLINE_RE = re.compile(
+    rb"(?P<code>`+)" + SAME_BLOCK + rb"+?(?P=code)"
+    rb"|(?P<image>!)?\[(?P<text>" + LINK_TEXT + rb")\]"
+    rb"(?:\([ \t]*<?(?P<url>" + LINK_URL + rb")>?"
+    rb"(?:\s+" + LINK_TITLE + rb")?[ \t]*\)"
+    rb"|\[(?P<ref>[^\]]*)\])?"
+    rb"|<(?P<autolink>[A-Za-z][A-Za-z0-9+.-]*://[^\s>]+)>"
+    rb"|<[aA]\s[^>]*?href=(?P<quote>[\"'])(?P<href>[^\"'>]*)(?P=quote)[^>]*>"
+    # An unclosed anchor ends at the next anchor or blank line, rather than
+    # swallowing (and backtracking over) the rest of the post
+    rb"(?P<html_text>(?:(?!<[aA]\s|\n[ \t]*\r?\n).)*?)</[aA]>",
+    re.S,
+)
+
+# Markup stripped from link and heading text, mirroring what renders as text
+MARKUP_CHAR_RE = re.compile(rb"[!\[`*_<\\&]")
+IMAGE_RE = re.compile(rb"!\[[^\]]*\]\([^)]*\)")
+NESTED_LINK_RE = re.compile(rb"\[([^\]]*)\](?:\([^)]*\)|\[[^\]]*\])")
+CODE_SPAN_RE = re.compile(rb"(`+)(.+?)\1", re.S)
+STRONG_EMPHASIS_RE = re.compile(rb"(\*{1,3})(?=\S)(.+?)(?<=\S)\1", re.S)
+UNDERSCORE_EMPHASIS_RE = re.compile(rb"(?<!\w)(_{1,3})(?=\S)(.+?)(?<=\S)\1(?!\w)", re.S)
+HTML_TAG_RE = re.compile(rb"<[^>]+>")
+ESCAPE_RE = re.compile(rb"\\([\\`*_{}\[\]()#+\-.!<>])")
+
+
+def clean_inline_text(raw: bytes) -> str:
+    """Reduce inline markdown to the plain text it renders as."""
+    if not MARKUP_CHAR_RE.search(raw):
+        return " ".join(raw.decode("utf-8").split())
+    text = IMAGE_RE.sub(b"", raw)
+    text = NESTED_LINK_RE.sub(rb"\1", text)
+    text = CODE_SPAN_RE.sub(rb"\2", text)
+    text = STRONG_EMPHASIS_RE.sub(rb"\2", text)
+    text = UNDERSCORE_EMPHASIS_RE.sub(rb"\2", text)
+    text = HTML_TAG_RE.sub(b"", text)
+    text = ESCAPE_RE.sub(rb"\1", text)
+    return " ".join(html.unescape(text.decode("utf-8")).split())
+
+
+def reference_key(label: bytes) -> bytes:
+    """Normalize a reference label the way markdown matches them."""
+    return b" ".join(label.lower().split())
+
+
+def extract_links_with_categories(
+    markdown_content: bytes, excluded_matcher: Optional[ahocorasick.Automaton]
+) -> List[Tuple[str, str, str]]:
+    """Extract all links and their text from markdown content, along with their categories.
+
+    Scans the raw UTF-8 markdown for headings (ATX and setext) and links
+    (inline, reference-style, autolinks and HTML anchors) and applies them in
+    document order, decoding only the matched text. Fenced code blocks,
+    inline code and images are skipped. Runs in worker processes, so it does
+    not log.
+    """
+    # Regions that never contribute headings or links
+    skipped = [match.span() for match in FENCE_RE.finditer(markdown_content)]
+    references = {}
+    for match in REFERENCE_DEF_RE.finditer(markdown_content):
+        if any(start <= match.start() < end for start, end in skipped):
+            continue
+        references.setdefault(reference_key(match.group("label")), match.group("url"))
+        skipped.append(match.span())
+    skipped.sort()
+    skipped_starts = [start for start, _ in skipped]
+
+    def is_skipped(position: int) -> bool:
+        index = bisect.bisect_right(skipped_starts, position) - 1
+        return index >= 0 and position < skipped[index][1]
+
+    # (position, heading level, heading text) or (position, None, link match)
+    events = []
+    for match in HEADING_RE.finditer(markdown_content):
+        events.append((match.start(), len(match.group("hashes")), match.group("text")))
+    for match in SETEXT_HEADING_RE.finditer(markdown_content):
+        # Like python-markdown, the text line has to start a block
+        start = match.start()
+        previous_line = markdown_content[
+            markdown_content.rfind(b"\n", 0, max(start - 1, 0)) + 1 : start
+        ]
+        if start == 0 or not previous_line.strip():
+            level = 1 if match.group("underline").startswith(b"=") else 2
+            events.append((start, level, match.group("text")))
+    for match in INLINE_RE.finditer(markdown_content):
+        events.append((match.start(), None, match))
+    events.sort(key=lambda event: event[0])
+
+    links = []
+    heading_tracker = HeadingTracker()
+
+    for position, level, item in events:
+        if is_skipped(position):
+            continue
+
+        if level is not None:
+            heading_tracker.update_heading(clean_inline_text(item), level)
+            continue
+
+        match = item
+        if match.group("code") or match.group("image"):
+            continue
+        if match.group("autolink"):
+            raw_text = link = match.group("autolink")
+        elif match.group("href") is not None:
+            raw_text = match.group("html_text")
+            link = html.unescape(match.group("href").decode("utf-8")).encode("utf-8")
+        elif match.group("url"):
+            raw_text, link = match.group("text"), match.group("url")
+        else:
+            raw_text = match.group("text")
+            link = references.get(reference_key(match.group("ref") or raw_text))
+            if link is None:
+                continue
+
+        text = clean_inline_text(raw_text)
+        link = link.decode("utf-8").strip()
+
+        if not link or not text:
+            continue
+
+        if excluded_matcher and next(excluded_matcher.iter(link), None):
+            continue
+
+        category_path = heading_tracker.get_category_path()
+        links.append((text, link, category_path))
+
+    return links
+
+
+def init_worker(excluded_matcher: Optional[ahocorasick.Automaton]) -> None:
+    """Store the excluded-domain matcher once per worker process."""
+    global worker_excluded_matcher
+    worker_excluded_matcher = excluded_matcher
+
+
+def extract_links_from_file(post_file: Path) -> List[Tuple[str, str, str]]:
+    """Extract links and categories from a post file without decoding it whole.
+
+    Defined at module level so it can be dispatched to worker processes, which
+    must have been set up with init_worker.
+    """
+    with open(post_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return extract_links_with_categories(content, worker_excluded_matcher)
+
+
+def chmod_and_retry(func, path: str, exc) -> None:
+    """Widen permissions on a path rmtree was denied access to and remove it.
+
+    Failed unlinks and rmdirs are retried directly. For the functions rmtree
+    uses to open and list directories the directory is made readable and
+    removed with remove_tree. Works both as an ``onexc`` handler, which
+    receives the exception, and as an ``onerror`` handler, which receives
+    ``sys.exc_info()``.
+    """
+    if isinstance(exc, tuple):
+        exc = exc[1]
+    if func is os.rmdir and isinstance(exc, FileNotFoundError):
+        # Already removed by the remove_tree call below for a directory that
+        # could not be listed
+        return
+    if not isinstance(exc, PermissionError):
+        raise exc
+    if func in (os.unlink, os.rmdir):
+        # Unlinking needs a writable parent on POSIX, a writable file on Windows
+        for target in (os.path.dirname(path), path):
+            os.chmod(target, os.stat(target).st_mode | stat.S_IWRITE | stat.S_IREAD)
+        func(path)
+    else:
+        # os.open or os.scandir on a directory that is not readable
+        os.chmod(path, os.stat(path).st_mode | stat.S_IRWXU)
+        remove_tree(path)
+
+
+def remove_tree(path: str) -> None:
+    """Remove a directory tree, retrying entries that are not writable."""
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=chmod_and_retry)
+    else:
+        shutil.rmtree(path, onerror=chmod_and_retry)
 
 
 class BitDevsRadar:
@@ -81,10 +340,15 @@ class BitDevsRadar:
         self.resources = {}  # url -> Resource object
         logger.info(f"Initializing BitDevsRadar with temp directory: {self.temp_dir}")
         self.excluded_domains = self.load_excluded_domains()
+        self.excluded_matcher = build_excluded_matcher(self.excluded_domains)
 
     @property
     def scanned_resources(self) -> Dict:
-        """Return the scanned resources in dictionary format."""
+        """Return the scanned resources in dictionary format.
+
+        Resources are left as ``Resource`` objects and converted with
+        ``Resource.to_dict`` when the data is saved or viewed.
+        """
         return {
             "metadata": {
                 "total_unique_urls": len(self.resources),
@@ -93,10 +357,7 @@ class BitDevsRadar:
                 else None,
                 "excluded_domains": list(self.excluded_domains),
             },
-            "resources": {
-                url: resource.to_dict()
-                for url, resource in sorted(self.resources.items())
-            },
+            "resources": dict(sorted(self.resources.items())),
         }
 
     def load_excluded_domains(self) -> Set[str]:
@@ -129,14 +390,34 @@ class BitDevsRadar:
             logger.error(f"Error loading configuration: {e}")
             raise
 
-    def clone_repo(self, repo_url: str, local_path: str) -> None:
-        """Clone a repository to a local directory."""
+    def clone_repo(self, repo_url: str, local_path: str, posts_dir: str) -> None:
+        """Clone only the posts directory of a repository at HEAD."""
         try:
             logger.debug(f"Cloning repository: {repo_url}")
-            git.Repo.clone_from(repo_url, local_path)
+            subprocess.run(
+                [
+                    "git",
+                    "clone",
+                    "--depth=1",
+                    "--filter=blob:none",
+                    "--sparse",
+                    "--single-branch",
+                    repo_url,
+                    local_path,
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            subprocess.run(
+                ["git", "-C", local_path, "sparse-checkout", "set", posts_dir],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
             logger.success(f"Successfully cloned {repo_url}")
-        except git.GitCommandError as e:
-            logger.error(f"Error cloning {repo_url}: {e}")
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Error cloning {repo_url}: {e.stderr.strip()}")
             raise
 
     def parse_post_date(self, filename: str) -> datetime:
@@ -147,104 +428,134 @@ class BitDevsRadar:
         logger.warning(f"Could not parse date from filename: {filename}")
         return None
 
-    def extract_links_with_categories(
-        self, markdown_content: str
-    ) -> List[Tuple[str, str, str]]:
-        """Extract all links and their text from markdown content, along with their categories."""
-        html = markdown.markdown(markdown_content)
-        soup = BeautifulSoup(html, "html.parser")
-
-        links = []
-        heading_tracker = HeadingTracker()
-
-        for element in soup.descendants:
-            if (
-                element.name
-                and not element.name.startswith("hr")
-                and element.name.startswith("h")
-            ):
-                level = int(element.name[1])
-                heading_tracker.update_heading(element.get_text(), level)
-
-            elif element.name == "a":
-                link = element.get("href", "").strip()
-                text = element.get_text().strip()
-
-                if not link or not text:
-                    continue
-
-                if any(excluded in link for excluded in self.excluded_domains):
-                    logger.debug(f"Skipping excluded domain: {link}")
-                    continue
-
-                category_path = heading_tracker.get_category_path()
-                links.append((text, link, category_path))
-
-        logger.debug(f"Extracted {len(links)} links from content")
-        return links
-
     def get_github_file_url(self, repo_url: str, relative_path: str) -> str:
         """Convert local file path to GitHub URL."""
         repo_url = repo_url.rstrip(".git")
         return f"{repo_url}/blob/master/{relative_path}"
 
-    def process_repository(self, repo_info: Dict) -> None:
-        """Process a single repository and update resource tracking."""
+    def clone_repository(self, repo_info: Dict) -> str:
+        """Clone a single repository into the temp directory and return its path."""
         repo_url = repo_info["url"]
         posts_dir = repo_info.get("posts_directory", "_posts")
-
-        logger.debug(f"Processing repository: {repo_url}")
         repo_path = os.path.join(self.temp_dir, repo_url.split("/")[-1])
-        self.clone_repo(repo_url, repo_path)
+        self.clone_repo(repo_url, repo_path, posts_dir)
+        return repo_path
 
+    def collect_posts(
+        self, repo_info: Dict, repo_path: str
+    ) -> List[Tuple[datetime, str, Path]]:
+        """Collect the (date, GitHub URL, local path) of every post to process."""
+        repo_url = repo_info["url"]
+        posts_dir = repo_info.get("posts_directory", "_posts")
+
+        logger.debug(f"Processing repository: {repo_url}")
         posts_path = Path(repo_path) / posts_dir
 
         if not posts_path.exists():
             logger.error(f"Posts directory not found: {posts_path}")
-            return
+            return []
 
-        post_count = 0
+        posts = []
         for post_file in posts_path.glob("*.md"):
             post_date = self.parse_post_date(post_file.name)
             if not post_date or (self.start_date and post_date < self.start_date):
-                logger.debug(f"Skipping post {post_file.name} (date: {post_date})")
+                logger.debug("Skipping post {} (date: {})", post_file.name, post_date)
                 continue
 
-            logger.debug(f"Processing post: {post_file.name}")
-            with open(post_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            links = self.extract_links_with_categories(content)
             relative_path = os.path.join(posts_dir, post_file.name)
             file_url = self.get_github_file_url(repo_url, relative_path)
+            posts.append((post_date, file_url, post_file))
 
-            for text, url, category_path in links:
-                if url not in self.resources:
-                    self.resources[url] = Resource(url)
-                self.resources[url].add_occurrence(
-                    post_date, file_url, category_path, text
-                )
-            post_count += 1
+        return posts
 
-        logger.info(f"Processed {post_count} posts from {repo_url}")
+    def add_links(
+        self, post_date: datetime, file_url: str, links: List[Tuple[str, str, str]]
+    ) -> None:
+        """Record the links extracted from a single post."""
+        for text, url, category_path in links:
+            if url not in self.resources:
+                self.resources[url] = Resource(url)
+            self.resources[url].add_occurrence(post_date, file_url, category_path, text)
 
     def scan_all_repos(self) -> None:
-        """Scan all repositories defined in the config file."""
+        """Scan all repositories defined in the config file.
+
+        Repositories are cloned concurrently in threads, then every post is
+        parsed in a process pool. Results are merged into ``self.resources``
+        in the main process, in the same order as a serial scan.
+        """
         config = self.load_config()
+        repositories = config["repositories"]
         logger.info("Starting repository scan")
 
-        for repo_info in config["repositories"]:
-            try:
-                self.process_repository(repo_info)
-            except Exception as e:
-                logger.error(f"Error processing repository {repo_info['url']}: {e}")
+        cloned = []
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(repositories)))) as pool:
+            futures = [
+                (repo_info, pool.submit(self.clone_repository, repo_info))
+                for repo_info in repositories
+            ]
+            for repo_info, future in futures:
+                try:
+                    cloned.append((repo_info, future.result()))
+                except Exception as e:
+                    logger.error(f"Error processing repository {repo_info['url']}: {e}")
+
+        with ProcessPoolExecutor(
+            initializer=init_worker, initargs=(self.excluded_matcher,)
+        ) as pool:
+            # Submit every post from every repository before collecting results
+            submitted = []
+            for repo_info, repo_path in cloned:
+                try:
+                    posts = self.collect_posts(repo_info, repo_path)
+                except Exception as e:
+                    logger.error(f"Error processing repository {repo_info['url']}: {e}")
+                    continue
+
+                futures = []
+                for post_date, file_url, post_file in posts:
+                    logger.debug("Processing post: {}", post_file.name)
+                    futures.append(
+                        (
+                            post_date,
+                            file_url,
+                            pool.submit(extract_links_from_file, post_file),
+                        )
+                    )
+                submitted.append((repo_info, futures))
+
+            for repo_info, futures in submitted:
+                try:
+                    for post_date, file_url, future in futures:
+                        links = future.result()
+                        logger.debug("Extracted {} links from {}", len(links), file_url)
+                        self.add_links(post_date, file_url, links)
+
+                    logger.info(
+                        f"Processed {len(futures)} posts from {repo_info['url']}"
+                    )
+                except Exception as e:
+                    logger.error(f"Error processing repository {repo_info['url']}: {e}")
 
         logger.success(f"Scan completed. Found {len(self.resources)} unique resources")
 
     def cleanup(self):
-        """Remove temporary directory and its contents."""
+        """Remove temporary directory and its contents.
+
+        Each cloned repository is removed in its own thread, since deletion is
+        dominated by per-file unlink syscalls that release the GIL.
+        """
         logger.info(f"Cleaning up temporary directory: {self.temp_dir}")
-        shutil.rmtree(self.temp_dir)
+        with os.scandir(self.temp_dir) as entries:
+            repo_dirs = [entry.path for entry in entries if entry.is_dir()]
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for future in [
+                pool.submit(remove_tree, repo_dir) for repo_dir in repo_dirs
+            ]:
+                future.result()
+
+        remove_tree(self.temp_dir)
         logger.debug("Cleanup completed")
 
     def __enter__(self):
@@ -0,0 +1,25 @@
+import os
+import sys
+
+import pytest
+
+from scanner import remove_tree
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32" or os.geteuid() == 0,
+    reason="needs POSIX permissions that are enforced for the current user",
+)
+def test_remove_tree_handles_unwritable_and_unreadable_directories(tmp_path):
+    root = tmp_path / "repo"
+    for name in ("unwritable", "unreadable", "unlistable"):
+        (root / name).mkdir(parents=True)
+        (root / name / "file").write_text("x")
+    (root / "unwritable" / "file").chmod(0o444)
+    (root / "unwritable").chmod(0o555)
+    (root / "unreadable").chmod(0o000)
+    (root / "unlistable").chmod(0o300)
+
+    remove_tree(str(root))
+
+    assert not root.exists()
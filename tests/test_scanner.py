@@ -0,0 +1,113 @@
+"""Regression tests for markdown link extraction.
+
+Unless noted otherwise, expected values are what the previous
+python-markdown + BeautifulSoup extractor returned for the same input.
+"""
+
+import time
+
+import pytest
+
+from scanner import extract_links_with_categories
+
+
+def extract(markdown: str):
+    return extract_links_with_categories(markdown.encode("utf-8"), None)
+
+
+def test_inline_triple_backticks_are_not_a_fence():
+    markdown = (
+        "# H\n\n"
+        "```OP_CHECKTEMPLATEVERIFY``` is proposed\n\n"
+        "## Next\n\n"
+        "[b](https://b.com)\n\n"
+        "[c](https://c.com)\n"
+    )
+    assert extract(markdown) == [
+        ("b", "https://b.com", "H / Next"),
+        ("c", "https://c.com", "H / Next"),
+    ]
+
+
+def test_unclosed_fence_does_not_hide_the_rest_of_the_post():
+    markdown = "# H\n\n```\nsome code\n\n## Next\n\n[b](https://b.com)\n"
+    assert extract(markdown) == [("b", "https://b.com", "H / Next")]
+
+
+def test_closed_fence_is_skipped():
+    # Deliberate difference: python-markdown ran without fenced_code, so it
+    # used to pick up headings and links from inside code blocks
+    markdown = (
+        "# H\n\n```python\n# Not a heading\n[x](https://x.com)\n```\n\n"
+        "[b](https://b.com)\n"
+    )
+    assert extract(markdown) == [("b", "https://b.com", "H")]
+
+
+def test_html_anchor():
+    markdown = 'Text <a class="c" href="https://a.com/?a=1&amp;b=2">a <b>x</b></a>\n'
+    assert extract(markdown) == [("a x", "https://a.com/?a=1&b=2", "")]
+
+
+def test_unclosed_html_anchor_does_not_swallow_the_next_one():
+    # Deliberate difference: BeautifulSoup closed the dangling anchor itself
+    # and also reported ("y", "x")
+    markdown = (
+        '<a href="https://ex0.com/p">zero</a> <a href="x">y \n\n'
+        '<a href="https://ex1.com/q">one</a>\n'
+    )
+    assert extract(markdown) == [
+        ("zero", "https://ex0.com/p", ""),
+        ("one", "https://ex1.com/q", ""),
+    ]
+    assert extract('<a href="x">y <a href="https://ex0.com/p">zero</a>\n') == [
+        ("zero", "https://ex0.com/p", "")
+    ]
+
+
+def test_many_unclosed_html_anchors_scan_in_linear_time():
+    start = time.perf_counter()
+    assert extract('<a href="x">y ' * 1000) == []
+    assert time.perf_counter() - start < 1
+
+
+@pytest.mark.parametrize(
+    "heading, category",
+    [
+        ("# Plain", "Plain"),
+        ("#NoSpace", "NoSpace"),
+        ("#\tTab", "Tab"),
+        ("## Foo ##", "Foo"),
+        ("## Foo##", "Foo"),
+        ("## C# ##", "C#"),
+        ("## Title #tag", "Title #tag"),
+        ("####### seven", "# seven"),
+        ("> # Quoted", "Quoted"),
+        (">#q", "q"),
+        ("> > # nested", "nested"),
+        ("* # item", "item"),
+        ("* #x", "x"),
+        ("- # dash", "dash"),
+        ("+ # plus", "plus"),
+        ("  * # indented item", "indented item"),
+        ("1. ## Num heading", "Num heading"),
+        ("10. # ten", "ten"),
+        ("> * # quote list", "quote list"),
+        ("* a\n* # b", "b"),
+        ("* a\n    * # nested", "nested"),
+        ("# H\n> ## Sub", "H / Sub"),
+        ("para\n# Inline heading", "Inline heading"),
+        ("Setext\n======", "Setext"),
+        ("# H\n\nSub\n---", "H / Sub"),
+        # Not headings
+        (" # one space", ""),
+        ("    # code", ""),
+        ("\\# escaped", ""),
+        ("*# nospace star", ""),
+        ("1) # paren", ""),
+    ],
+)
+def test_heading_categories_match_python_markdown(heading, category):
+    assert extract(heading + "\n[a](https://a.com)\n") == [
+        ("a", "https://a.com", category)
+    ]
@@ -0,0 +1,50 @@
+from datetime import datetime
+
+import orjson
+
+from scanner import Resource
+from views import precompute_derived, save_detailed_view
+
+
+def test_resources_are_converted_once_for_save_and_views(tmp_path):
+    resource = Resource("https://a.com/x")
+    resource.add_occurrence(datetime(2024, 5, 1), "https://src/1", "Cat", "A")
+    resource.add_occurrence(datetime(2024, 6, 1), "https://src/2", "Cat", "A")
+    data = {"metadata": {}, "resources": {resource.url: resource}}
+
+    output = tmp_path / "resources.json"
+    save_detailed_view(data, str(output))
+    saved = resource.cached_dict
+    precompute_derived(data)
+
+    assert orjson.loads(output.read_bytes())["resources"][resource.url] == {
+        "url": "https://a.com/x",
+        "titles": ["A"],
+        "count": 2,
+        "occurrences": [
+            {
+                "date": "2024-05-01",
+                "source": "https://src/1",
+                "category": "Cat",
+                "title_used": "A",
+            },
+            {
+                "date": "2024-06-01",
+                "source": "https://src/2",
+                "category": "Cat",
+                "title_used": "A",
+            },
+        ],
+    }
+    # The views reuse the dictionary built while saving
+    assert data["resources"][resource.url] is saved
+    assert saved["_domain"] == "a.com"
+    assert saved["_latest_date"] == datetime(2024, 6, 1)
+
+
+def test_adding_an_occurrence_invalidates_the_cached_dict():
+    resource = Resource("https://a.com/x")
+    resource.add_occurrence(datetime(2024, 5, 1), "https://src/1", "Cat", "A")
+    assert resource.to_dict()["count"] == 1
+    resource.add_occurrence(datetime(2024, 6, 1), "https://src/2", "Cat", "B")
+    assert resource.to_dict()["count"] == 2
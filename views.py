@@ -1,27 +1,30 @@
-from urllib.parse import urlparse
-from collections import defaultdict
+from urllib.parse import urlsplit
+from collections import Counter, defaultdict
 from typing import Dict
 from datetime import datetime
-import json
+import orjson
 from loguru import logger
 
 
 def get_most_common_category(resource: Dict) -> str:
     """Determine the most common category for a resource."""
-    category_counts = defaultdict(int)
-    for occurrence in resource["occurrences"]:
-        category_counts[occurrence["category"]] += 1
-    most_common = max(category_counts.items(), key=lambda x: x[1])[0]
-    logger.trace(f"Most common category for resource: {most_common}")
-    return most_common
+    occurrences = resource["occurrences"]
+    if len(occurrences) == 1:
+        return occurrences[0]["category"]
+    # Ties go to the category seen first, as with max() over the counts
+    category_counts = Counter(occurrence["category"] for occurrence in occurrences)
+    return category_counts.most_common(1)[0][0]
 
 
 def get_domain(url: str) -> str:
     """Extract and clean domain from URL."""
-    domain = urlparse(url).netloc
-    clean_domain = domain.replace("www.", "")
-    logger.trace(f"Extracted domain {clean_domain} from {url}")
-    return clean_domain
+    domain = urlsplit(url).netloc
+    return domain.replace("www.", "")
+
+
+def parse_date(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD date without the overhead of datetime.strptime."""
+    return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
 
 
 def format_reference_count(count: int) -> str:
@@ -31,69 +34,124 @@ def format_reference_count(count: int) -> str:
     return f" ({count} references)"
 
 
-def get_latest_date(resource: Dict) -> datetime:
-    """Get the most recent occurrence date for a resource."""
-    return max(
-        datetime.strptime(occ["date"], "%Y-%m-%d") for occ in resource["occurrences"]
-    )
-
-
-def write_metadata_section(f, data: Dict):
-    """Write metadata section at the top of the markdown file."""
-    logger.debug("Writing metadata section")
+def precompute_derived(data: Dict) -> None:
+    """Annotate each resource with the fields derived from its occurrences.
+
+    Adds ``_category``, ``_domain``, ``_earliest_date`` and ``_latest_date``,
+    plus the rendered ``_titles_str`` and ``_ref_count``, so the markdown
+    views don't recompute them. Must be called before generating any of the
+    markdown views. ``Resource`` objects from a fresh scan are replaced by
+    their dictionary form first; ``to_dict`` caches it, so resources already
+    serialized by save_detailed_view aren't converted again.
+    """
+    logger.debug("Precomputing derived resource fields")
+    resources = data["resources"]
+    for url, resource in resources.items():
+        if not isinstance(resource, dict):
+            resource = resources[url] = resource.to_dict()
+        resource["_domain"] = get_domain(url)
+        resource["_titles_str"] = " | ".join(
+            '"' + title + '"' for title in resource["titles"]
+        )
+        resource["_ref_count"] = format_reference_count(resource["count"])
+        if not resource["occurrences"]:
+            continue
+        dates = [parse_date(occ["date"]) for occ in resource["occurrences"]]
+        resource["_category"] = get_most_common_category(resource)
+        resource["_earliest_date"] = min(dates)
+        resource["_latest_date"] = max(dates)
+
+
+def render_metadata_section(data: Dict) -> str:
+    """Render the metadata section shown at the top of every markdown view."""
+    logger.debug("Rendering metadata section")
     total_resources = len(data["resources"])
     total_references = sum(resource["count"] for resource in data["resources"].values())
 
     # Calculate date range
-    all_dates = [
-        datetime.strptime(occ["date"], "%Y-%m-%d")
-        for resource in data["resources"].values()
-        for occ in resource["occurrences"]
+    dated_resources = [
+        resource for resource in data["resources"].values() if resource["occurrences"]
     ]
-    start_date = min(all_dates).strftime("%Y-%m-%d")
-    end_date = max(all_dates).strftime("%Y-%m-%d")
+    start_date = min(r["_earliest_date"] for r in dated_resources).strftime("%Y-%m-%d")
+    end_date = max(r["_latest_date"] for r in dated_resources).strftime("%Y-%m-%d")
 
     # Calculate unique domains
-    domains = {get_domain(url) for url in data["resources"].keys()}
+    domains = {resource["_domain"] for resource in data["resources"].values()}
 
     logger.info(
         f"Metadata summary: {total_resources} resources, {total_references} references, {len(domains)} domains"
     )
 
-    f.write("# BitDevs Resources Report\n\n")
-    f.write("## Metadata\n\n")
-    f.write(f"- **Total Unique Resources**: {total_resources}\n")
-    f.write(f"- **Total References**: {total_references}\n")
-    f.write(f"- **Date Range**: {start_date} to {end_date}\n")
-    f.write(f"- **Unique Domains**: {len(domains)}\n")
+    parts = []
+    parts.append("# BitDevs Resources Report\n\n")
+    parts.append("## Metadata\n\n")
+    parts.append(f"- **Total Unique Resources**: {total_resources}\n")
+    parts.append(f"- **Total References**: {total_references}\n")
+    parts.append(f"- **Date Range**: {start_date} to {end_date}\n")
+    parts.append(f"- **Unique Domains**: {len(domains)}\n")
     if data["metadata"].get("excluded_domains"):
-        f.write("- **Excluded Domains**:\n")
+        parts.append("- **Excluded Domains**:\n")
         for domain in sorted(data["metadata"]["excluded_domains"]):
-            f.write(f"  - {domain}\n")
-
+            parts.append(f"  - {domain}\n")
+    return "".join(parts)
 
-def generate_domain_view(data: Dict, output_file: str):
-    """Generate a view organized by root domains."""
-    logger.info(f"Generating domain view to {output_file}")
 
-    # Group resources by domain
+def group_resources(data: Dict) -> Dict:
+    """Group resources by category, domain and month in a single pass."""
+    logger.debug("Grouping resources for views")
+    categorized = defaultdict(lambda: defaultdict(list))
     domain_resources = defaultdict(list)
     domain_stats = defaultdict(lambda: {"total_refs": 0, "unique_resources": 0})
+    monthly_resources = defaultdict(lambda: defaultdict(list))
+    # Reference totals used as sort keys by the views
+    category_totals = defaultdict(int)
+    category_domain_totals = defaultdict(lambda: defaultdict(int))
+    monthly_domain_totals = defaultdict(lambda: defaultdict(int))
 
     for url, resource in data["resources"].items():
-        domain = get_domain(url)
-        latest_date = get_latest_date(resource)
-        domain_resources[domain].append(
-            {
-                "url": url,
-                "titles": resource["titles"],
-                "count": resource["count"],
-                "category": get_most_common_category(resource),
-                "latest_date": latest_date,
-            }
-        )
-        domain_stats[domain]["total_refs"] += resource["count"]
+        if not resource["occurrences"]:
+            continue
+
+        category = resource["_category"]
+        domain = resource["_domain"]
+        latest_date = resource["_latest_date"]
+        month_key = latest_date.strftime("%Y-%m")
+        count = resource["count"]
+        entry = {
+            "url": url,
+            "titles_str": resource["_titles_str"],
+            "ref_count": resource["_ref_count"],
+            "count": count,
+            "category": category,
+            "domain": domain,
+            "latest_date": latest_date,
+        }
+
+        categorized[category][domain].append(entry)
+        category_totals[category] += count
+        category_domain_totals[category][domain] += count
+        domain_resources[domain].append(entry)
+        domain_stats[domain]["total_refs"] += count
         domain_stats[domain]["unique_resources"] += 1
+        monthly_resources[month_key][domain].append(entry)
+        monthly_domain_totals[month_key][domain] += count
+
+    return {
+        "categorized": categorized,
+        "category_totals": category_totals,
+        "category_domain_totals": category_domain_totals,
+        "domain_resources": domain_resources,
+        "domain_stats": domain_stats,
+        "monthly_resources": monthly_resources,
+        "monthly_domain_totals": monthly_domain_totals,
+    }
+
+
+def write_domain_view(groups: Dict, metadata_section: str, output_file: str):
+    """Write a view organized by root domains from pre-grouped resources."""
+    logger.info(f"Generating domain view to {output_file}")
+    domain_resources = groups["domain_resources"]
+    domain_stats = groups["domain_stats"]
 
     # Sort domains by total references
     sorted_domains = sorted(
@@ -105,36 +163,37 @@ def generate_domain_view(data: Dict, output_file: str):
     logger.debug(f"Processing {len(sorted_domains)} domains")
 
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            # Write metadata section
-            write_metadata_section(f, data)
+        parts = []
+        append = parts.append
 
-            f.write("# Resources by Domain\n\n")
+        # Write metadata section
+        append(metadata_section)
 
-            for domain, stats in sorted_domains:
-                logger.debug(f"Writing domain section: {domain}")
-                f.write(
-                    f"## {domain} ({stats['unique_resources']} resources, {stats['total_refs']} total references)\n\n"
-                )
+        append("# Resources by Domain\n\n")
 
-                # Sort resources by latest date
-                resources = sorted(
-                    domain_resources[domain],
-                    key=lambda x: x["latest_date"],
-                    reverse=True,
+        for domain, stats in sorted_domains:
+            logger.debug(f"Writing domain section: {domain}")
+            append(
+                f"## {domain} ({stats['unique_resources']} resources, {stats['total_refs']} total references)\n\n"
+            )
+
+            # Sort resources by latest date
+            resources = sorted(
+                domain_resources[domain],
+                key=lambda x: x["latest_date"],
+                reverse=True,
+            )
+
+            # Write all resources directly
+            for resource in resources:
+                append(
+                    f"- [{resource['titles_str']}]({resource['url']}){resource['ref_count']} "
+                    f"(Category: {resource['category']})\n"
                 )
+            append("\n")
 
-                # Write all resources directly
-                for resource in resources:
-                    titles_str = " | ".join(
-                        f'"{title}"' for title in resource["titles"]
-                    )
-                    ref_count = format_reference_count(resource["count"])
-                    f.write(
-                        f"- [{titles_str}]({resource['url']}){ref_count} "
-                        f"(Category: {resource['category']})\n"
-                    )
-                f.write("\n")
+        with open(output_file, "wb") as f:
+            f.write("".join(parts).encode("utf-8"))
 
         logger.success(f"Successfully generated domain view at {output_file}")
     except Exception as e:
@@ -142,106 +201,83 @@ def generate_domain_view(data: Dict, output_file: str):
         raise
 
 
-def generate_date_view(data: Dict, output_file: str):
-    """Generate a view organized by date and then by domain."""
+def write_date_view(groups: Dict, metadata_section: str, output_file: str):
+    """Write a view organized by date and then by domain from grouped resources."""
     logger.info(f"Generating date view to {output_file}")
-
-    # Group resources by month and domain
-    monthly_resources = defaultdict(lambda: defaultdict(list))
-
-    for url, resource in data["resources"].items():
-        latest_date = get_latest_date(resource)
-        month_key = latest_date.strftime("%Y-%m")
-        domain = get_domain(url)
-
-        monthly_resources[month_key][domain].append(
-            {
-                "url": url,
-                "titles": resource["titles"],
-                "count": resource["count"],
-                "category": get_most_common_category(resource),
-                "latest_date": latest_date,
-            }
-        )
+    monthly_resources = groups["monthly_resources"]
+    monthly_domain_totals = groups["monthly_domain_totals"]
 
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            # Write metadata section
-            write_metadata_section(f, data)
+        parts = []
+        append = parts.append
 
-            f.write("# Resources by Date\n\n")
+        # Write metadata section
+        append(metadata_section)
 
-            # Sort months in reverse chronological order
-            for month in sorted(monthly_resources.keys(), reverse=True):
-                month_display = datetime.strptime(month, "%Y-%m").strftime("%B %Y")
-                f.write(f"## {month_display}\n\n")
+        append("# Resources by Date\n\n")
 
-                # Collect all resources for domains with <= 5 resources
-                ungrouped_resources = []
-                domains_to_group = {}
+        # Sort months in reverse chronological order
+        for month in sorted(monthly_resources.keys(), reverse=True):
+            month_display = datetime.strptime(month, "%Y-%m").strftime("%B %Y")
+            append(f"## {month_display}\n\n")
 
-                # Sort domains by total references within the month
-                for domain, resources in monthly_resources[month].items():
-                    if len(resources) <= 5:
-                        ungrouped_resources.extend(resources)
-                    else:
-                        domains_to_group[domain] = resources
+            # Collect all resources for domains with <= 5 resources
+            ungrouped_resources = []
+            domains_to_group = {}
 
-                # Handle domains with more than 5 resources
-                if domains_to_group:
-                    # Sort domains by total references
-                    domain_refs = {
-                        domain: sum(r["count"] for r in resources)
-                        for domain, resources in domains_to_group.items()
-                    }
-                    sorted_domains = sorted(
-                        domains_to_group.items(),
-                        key=lambda x: domain_refs[x[0]],
-                        reverse=True,
-                    )
+            # Sort domains by total references within the month
+            for domain, resources in monthly_resources[month].items():
+                if len(resources) <= 5:
+                    ungrouped_resources.extend(resources)
+                else:
+                    domains_to_group[domain] = resources
 
-                    for domain, resources in sorted_domains:
-                        f.write(f"### {domain}\n\n")
+            # Handle domains with more than 5 resources
+            if domains_to_group:
+                # Sort domains by total references
+                domain_refs = monthly_domain_totals[month]
+                sorted_domains = sorted(
+                    domains_to_group.items(),
+                    key=lambda x: domain_refs[x[0]],
+                    reverse=True,
+                )
 
-                        # Sort resources by date
-                        sorted_resources = sorted(
-                            resources, key=lambda x: x["latest_date"], reverse=True
-                        )
+                for domain, resources in sorted_domains:
+                    append(f"### {domain}\n\n")
 
-                        for resource in sorted_resources:
-                            titles_str = " | ".join(
-                                f'"{title}"' for title in resource["titles"]
-                            )
-                            ref_count = format_reference_count(resource["count"])
-                            f.write(
-                                f"- [{titles_str}]({resource['url']}){ref_count} "
-                                f"(Category: {resource['category']})\n"
-                            )
-                        f.write("\n")
-
-                # Handle ungrouped resources
-                if ungrouped_resources:
-                    if domains_to_group:
-                        f.write("### Other Resources\n\n")
-
-                    # Sort ungrouped resources by date
+                    # Sort resources by date
                     sorted_resources = sorted(
-                        ungrouped_resources,
-                        key=lambda x: x["latest_date"],
-                        reverse=True,
+                        resources, key=lambda x: x["latest_date"], reverse=True
                     )
 
                     for resource in sorted_resources:
-                        titles_str = " | ".join(
-                            f'"{title}"' for title in resource["titles"]
+                        append(
+                            f"- [{resource['titles_str']}]({resource['url']}){resource['ref_count']} "
+                            f"(Category: {resource['category']})\n"
                         )
-                        ref_count = format_reference_count(resource["count"])
-                        domain = get_domain(resource["url"])
-                        f.write(
-                            f"- [{titles_str}]({resource['url']}){ref_count} "
-                            f"(Category: {resource['category']}, Domain: {domain})\n"
-                        )
-                    f.write("\n")
+                    append("\n")
+
+            # Handle ungrouped resources
+            if ungrouped_resources:
+                if domains_to_group:
+                    append("### Other Resources\n\n")
+
+                # Sort ungrouped resources by date
+                sorted_resources = sorted(
+                    ungrouped_resources,
+                    key=lambda x: x["latest_date"],
+                    reverse=True,
+                )
+
+                for resource in sorted_resources:
+                    append(
+                        f"- [{resource['titles_str']}]({resource['url']}){resource['ref_count']} "
+                        f"(Category: {resource['category']}, Domain: {resource['domain']})\n"
+                    )
+                append("\n")
+
+        with open(output_file, "wb") as f:
+            f.write("".join(parts).encode("utf-8"))
 
         logger.success(f"Successfully generated date view at {output_file}")
     except Exception as e:
@@ -249,27 +285,11 @@ def generate_date_view(data: Dict, output_file: str):
         raise
 
 
-def generate_category_view(data: Dict, output_file: str):
-    """Generate the organized markdown view."""
+def write_category_view(groups: Dict, metadata_section: str, output_file: str):
+    """Write the organized markdown view from pre-grouped resources."""
     logger.info(f"Generating category view to {output_file}")
-
-    # Group resources by category and domain
-    categorized = defaultdict(lambda: defaultdict(list))
-
-    for url, resource in data["resources"].items():
-        if resource["occurrences"]:
-            category = get_most_common_category(resource)
-            domain = get_domain(url)
-            latest_date = get_latest_date(resource)
-
-            categorized[category][domain].append(
-                {
-                    "url": url,
-                    "titles": resource["titles"],
-                    "count": resource["count"],
-                    "latest_date": latest_date,
-                }
-            )
+    category_totals = groups["category_totals"]
+    category_domain_totals = groups["category_domain_totals"]
 
     # Sort resources within each domain by latest date
     categorized = {
@@ -277,70 +297,70 @@ def generate_category_view(data: Dict, output_file: str):
             domain: sorted(resources, key=lambda x: x["latest_date"], reverse=True)
             for domain, resources in domains.items()
         }
-        for category, domains in categorized.items()
+        for category, domains in groups["categorized"].items()
     }
 
     # Sort categories by total references
     sorted_categories = sorted(
         categorized.items(),
-        key=lambda x: sum(
-            sum(r["count"] for r in resources) for domain, resources in x[1].items()
-        ),
+        key=lambda x: category_totals[x[0]],
         reverse=True,
     )
 
     logger.debug(f"Processing {len(sorted_categories)} categories")
 
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            # Write metadata section
-            write_metadata_section(f, data)
+        parts = []
+        append = parts.append
 
-            f.write("# Resources by Category\n\n")
+        # Write metadata section
+        append(metadata_section)
 
-            for category, domains in sorted_categories:
-                logger.debug(f"Writing category section: {category}")
-                f.write(f"## {category}\n\n")
+        append("# Resources by Category\n\n")
 
-                # Sort domains by total references
-                sorted_domains = sorted(
-                    domains.items(),
-                    key=lambda x: sum(r["count"] for r in x[1]),
-                    reverse=True,
-                )
+        for category, domains in sorted_categories:
+            logger.debug(f"Writing category section: {category}")
+            append(f"## {category}\n\n")
 
-                # First, handle domains with multiple resources
-                for domain, resources in sorted_domains:
-                    if len(resources) > 1:
-                        f.write(f"### {domain}\n\n")
-                        for resource in resources:  # Already sorted by date
-                            titles_str = " | ".join(
-                                f'"{title}"' for title in resource["titles"]
-                            )
-                            ref_count = format_reference_count(resource["count"])
-                            f.write(f"- [{titles_str}]({resource['url']}){ref_count}\n")
-                        f.write("\n")
-
-                # Then, handle domains with single resources
-                single_resources = []
-                for domain, resources in sorted_domains:
-                    if len(resources) == 1:
-                        single_resources.extend(resources)
+            # Sort domains by total references
+            domain_totals = category_domain_totals[category]
+            sorted_domains = sorted(
+                domains.items(),
+                key=lambda x: domain_totals[x[0]],
+                reverse=True,
+            )
 
-                if single_resources:
-                    # Sort single resources by date
-                    single_resources.sort(key=lambda x: x["latest_date"], reverse=True)
+            # First, handle domains with multiple resources
+            for domain, resources in sorted_domains:
+                if len(resources) > 1:
+                    append(f"### {domain}\n\n")
+                    for resource in resources:  # Already sorted by date
+                        append(
+                            f"- [{resource['titles_str']}]({resource['url']}){resource['ref_count']}\n"
+                        )
+                    append("\n")
 
-                    if any(len(resources) > 1 for domain, resources in sorted_domains):
-                        f.write("### Other Resources\n\n")
+            # Then, handle domains with single resources
+            single_resources = []
+            for domain, resources in sorted_domains:
+                if len(resources) == 1:
+                    single_resources.extend(resources)
 
-                    for resource in single_resources:
-                        titles_str = " | ".join(
-                            f'"{title}"' for title in resource["titles"]
-                        )
-                        ref_count = format_reference_count(resource["count"])
-                        f.write(f"- [{titles_str}]({resource['url']}){ref_count}\n")
-                    f.write("\n")
+            if single_resources:
+                # Sort single resources by date
+                single_resources.sort(key=lambda x: x["latest_date"], reverse=True)
+
+                if any(len(resources) > 1 for domain, resources in sorted_domains):
+                    append("### Other Resources\n\n")
+
+                for resource in single_resources:
+                    append(
+                        f"- [{resource['titles_str']}]({resource['url']}){resource['ref_count']}\n"
+                    )
+                append("\n")
+
+        with open(output_file, "wb") as f:
+            f.write("".join(parts).encode("utf-8"))
 
         logger.success(f"Successfully generated category view at {output_file}")
     except Exception as e:
@@ -348,12 +368,37 @@ def generate_category_view(data: Dict, output_file: str):
         raise
 
 
+def generate_all_views(
+    data: Dict, category_output: str, domain_output: str, date_output: str
+):
+    """Generate the category, domain and date views from a single grouping pass.
+
+    Expects data already annotated by precompute_derived.
+    """
+    groups = group_resources(data)
+    metadata_section = render_metadata_section(data)
+    write_category_view(groups, metadata_section, category_output)
+    write_domain_view(groups, metadata_section, domain_output)
+    write_date_view(groups, metadata_section, date_output)
+
+
+def serialize_resource(obj):
+    """Serialize ``Resource`` objects on demand while dumping the detailed view."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
 def save_detailed_view(data: Dict, output_file: str):
     """Save the detailed JSON view."""
     logger.info(f"Saving detailed view to {output_file}")
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        with open(output_file, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data, default=serialize_resource, option=orjson.OPT_INDENT_2
+                )
+            )
         logger.success(f"Successfully saved detailed view to {output_file}")
     except Exception as e:
         logger.error(f"Error saving detailed view: {e}")